@@ -62,7 +62,7 @@ resume = Resume(
                     description=BulletedList(
                         [
                             "Worked as a technical lead for a petabyte-scale, globally distributed database. Reduced number of production incidents by 80%.",
-                            'Founded a team that built a Python microservice that would perform real-time root cause analysis/mitigation of incidents and eliminate the need for an on-call engineer. Open sourced this work on Github as <a class="open-link" target="_blank" href="http://github.com/microsoft/jupyrest">Jupyrest</a>',
+                            'Founded a team that built a Python microservice that would perform real-time root cause analysis/mitigation of incidents and eliminate the need for an on-call engineer. Open sourced this work on Github as <a class="open-link" target="_blank" href="http://github.com/microsoft/jupyrest">Jupyrest<svg><use href="#extlink"/></svg></a>',
                         ]
                     ),
                 ),
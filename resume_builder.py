@@ -1,78 +1,169 @@
 from textwrap import dedent
-from typing import Optional, List, Union
-import argparse
+from typing import BinaryIO, Iterator, Optional, List, Union
+import sys
 
 
 class Text:
+    __slots__ = ("text", "_cached")
+
     def __init__(self, text: str) -> None:
         self.text = text
+        # Rendered-HTML cache; these nodes are immutable, so subclasses
+        # build their string form once and reuse it on later renders.
+        self._cached: Optional[str] = None
 
-    def __str__(self) -> str:
+    def _as_html(self) -> str:
         return self.text
 
+    __str__ = _as_html
+
 
 StrLike = Union[str, Text]
 OptionalStrLike = Optional[StrLike]
 
 
+def _s(value: StrLike) -> str:
+    """HTML form of a render-tree value.
+
+    Plain strings pass through untouched (resume definitions may embed
+    raw HTML in them), Text nodes render via _as_html without bouncing
+    through str(), and anything else falls back to str().
+    """
+    if type(value) is str:
+        return value
+    as_html = getattr(value, "_as_html", None)
+    return as_html() if as_html is not None else str(value)
+
+
+_ESCAPE_TT = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"}
+)
+
+
+def _escape(value: str) -> str:
+    """Escape HTML-significant characters in a single translate pass."""
+    return value.translate(_ESCAPE_TT)
+
+
+def _split_template(template: str, placeholders: List[str]) -> List[str]:
+    """Split a template into the static chunks around each placeholder.
+
+    Returns len(placeholders) + 1 chunks so the rendered document can be
+    assembled in a single pass instead of re-scanning the whole template
+    once per str.replace call.
+    """
+    chunks = []
+    for placeholder in placeholders:
+        static, _, template = template.partition(placeholder)
+        chunks.append(static)
+    chunks.append(template)
+    return chunks
+
+
+# Anchor markup for LinkText, indexed by show_icon.
+_LINK_FMT = (
+    '<a target="_blank" href="{url}">{text}</a>',
+    '<a target="_blank" class="open-link" href="{url}">{text}<svg><use href="#extlink"/></svg></a>',
+)
+
+
 class LinkText(Text):
+    __slots__ = ("url", "show_icon")
+
     def __init__(self, text: str, url: str, show_icon: bool = False) -> None:
         super().__init__(text)
         self.url = url
         self.show_icon = show_icon
 
-    def __str__(self) -> str:
-        if not self.show_icon:
-            return f'<a target="_blank" href="{self.url}">{self.text}</a>'
-        else:
-            return f'<a target="_blank" class="open-link" href="{self.url}">{self.text}</a>'
+    def _as_html(self) -> str:
+        cached = self._cached
+        if cached is None:
+            cached = self._cached = _LINK_FMT[bool(self.show_icon)].format(
+                url=_escape(self.url), text=_escape(self.text)
+            )
+        return cached
+
+    __str__ = _as_html
 
 
 class BulletedList(Text):
+    __slots__ = ("items",)
+
     def __init__(self, items: List[StrLike]) -> None:
         self.items = items
+        self._cached = None
 
-    def __str__(self) -> str:
-        s = "<ul>\n"
-        for item in self.items:
-            s += f"<li><p>{item}</p></li>\n"
-        s += "</ul>\n"
-        return s
+    def _as_html(self) -> str:
+        cached = self._cached
+        if cached is None:
+            cached = self._cached = "<ul>\n%s</ul>\n" % "".join(
+                ["<li><p>%s</p></li>\n" % item for item in self.items]
+            )
+        return cached
+
+    __str__ = _as_html
 
 
 class ItalicsText(Text):
-    def __init__(self, text: str) -> None:
-        super().__init__(text)
+    __slots__ = ()
 
-    def __str__(self) -> str:
-        return f"<i>{self.text}</i>"
+    def _as_html(self) -> str:
+        cached = self._cached
+        if cached is None:
+            cached = self._cached = f"<i>{self.text}</i>"
+        return cached
+
+    __str__ = _as_html
 
 
 class UnderlinedText(Text):
-    def __init__(self, text: str) -> None:
-        super().__init__(text)
+    __slots__ = ()
+
+    def _as_html(self) -> str:
+        cached = self._cached
+        if cached is None:
+            cached = self._cached = f'<span class="label">{self.text}</span>'
+        return cached
 
-    def __str__(self) -> str:
-        return f'<span class="label">{self.text}</span>'
+    __str__ = _as_html
 
 
 class BoldText(Text):
-    def __init__(self, text: str) -> None:
-        super().__init__(text)
+    __slots__ = ()
+
+    def _as_html(self) -> str:
+        cached = self._cached
+        if cached is None:
+            cached = self._cached = f"<strong>{self.text}</strong>"
+        return cached
 
-    def __str__(self) -> str:
-        return f"<strong>{self.text}</strong>"
+    __str__ = _as_html
 
 
 class ConcatText(Text):
+    __slots__ = ("args",)
+
     def __init__(self, *args: StrLike) -> None:
-        self.args = args
+        # Intern the plain-string fragments: the same literals tend to
+        # recur across entries (label prefixes, separators), and interned
+        # strings are shared and hash/compare by identity.
+        self.args = tuple(
+            sys.intern(arg) if type(arg) is str else arg for arg in args
+        )
+        self._cached = None
 
-    def __str__(self) -> str:
-        return "".join(map(str, self.args))
+    def _as_html(self) -> str:
+        cached = self._cached
+        if cached is None:
+            cached = self._cached = "".join([_s(arg) for arg in self.args])
+        return cached
+
+    __str__ = _as_html
 
 
 class SectionEntry:
+    __slots__ = ("title", "caption", "location", "dates", "description", "_rendered")
+
     def __init__(
         self,
         title: OptionalStrLike = None,
@@ -86,15 +177,51 @@ class SectionEntry:
         self.location = location
         self.dates = dates
         self.description = description
+        self._rendered: Optional[str] = None
+
+    def render(self) -> str:
+        cached = self._rendered
+        if cached is not None:
+            return cached
+        parts = ['<div class="entry">\n']
+        append = parts.append
+        for attr, prefix, suffix in _ENTRY_FIELDS:
+            value = getattr(self, attr)
+            if value is not None:
+                append(prefix)
+                append(_s(value))
+                append(suffix)
+        append("</div>\n")
+        cached = self._rendered = "".join(parts)
+        return cached
 
 
 class Section:
+    __slots__ = ("title", "entries", "_rendered")
+
     def __init__(self, title: StrLike, entries: List[SectionEntry]) -> None:
         self.title = title
         self.entries = entries
+        self._rendered: Optional[str] = None
+
+    def render(self) -> str:
+        cached = self._rendered
+        if cached is not None:
+            return cached
+        parts = ["<section>\n"]
+        append = parts.append
+        if self.title:
+            append(f"<h2>{_s(self.title)}</h2>\n")
+        for entry in self.entries:
+            append(entry.render())
+        append("</section>\n")
+        cached = self._rendered = "".join(parts)
+        return cached
 
 
 class ContactInfo:
+    __slots__ = ("name", "details", "tag_line")
+
     def __init__(
         self,
         name: StrLike,
@@ -107,6 +234,8 @@ class ContactInfo:
 
 
 class Summary:
+    __slots__ = ("title", "description")
+
     def __init__(
         self, title: OptionalStrLike = None, description: OptionalStrLike = None
     ) -> None:
@@ -114,126 +243,229 @@ class Summary:
         self.description = description
 
 
+# Sections render independently, so past this count render_sections
+# fans out to a thread pool; below it the pool setup costs more than it
+# saves.
+_PARALLEL_SECTION_THRESHOLD = 16
+
+# SectionEntry fields in render order, each with the constant markup
+# emitted around its value; SectionEntry.render walks this table instead
+# of branching per field.
+_ENTRY_FIELDS = (
+    ("title", "<h3>", "</h3>\n"),
+    ("caption", '<span class="role">', "</span>\n"),
+    ("location", '<span class="loc">', "</span>\n"),
+    ("dates", '<span class="date">', "</span>\n"),
+    ("description", "<p>\n", "</p>\n"),
+)
+
+_TEMPLATE = dedent(
+    """
+<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width; initial-scale=1.0; maximum-scale=1.0; user-scalable=0;" />
+<title>__NAME__&rsquo;s Resume</title>
+<style>
+html{font-family:sans-serif;-ms-text-size-adjust:100%;-webkit-text-size-adjust:100%}body{margin:0}article,aside,details,figcaption,figure,footer,header,hgroup,main,menu,nav,section,summary{display:block}audio,canvas,progress,video{display:inline-block;vertical-align:baseline}audio:not([controls]){display:none;height:0}[hidden],template{display:none}a{background-color:transparent}a:active,a:hover{outline:0}abbr[title]{border-bottom:1px dotted}b,strong{font-weight:bold}dfn{font-style:italic}h1{font-size:2em;margin:0.67em 0}mark{background:#ff0;color:#000}small{font-size:80%}sub,sup{font-size:75%;line-height:0;position:relative;vertical-align:baseline}sup{top:-0.5em}sub{bottom:-0.25em}img{border:0}svg:not(:root){overflow:hidden}figure{margin:1em 40px}hr{-moz-box-sizing:content-box;box-sizing:content-box;height:0}pre{overflow:auto}code,kbd,pre,samp{font-family:monospace, monospace;font-size:1em}button,input,optgroup,select,textarea{color:inherit;font:inherit;margin:0}button{overflow:visible}button,select{text-transform:none}button,html input[type="button"],input[type="reset"],input[type="submit"]{-webkit-appearance:button;cursor:pointer}button[disabled],html input[disabled]{cursor:default}button::-moz-focus-inner,input::-moz-focus-inner{border:0;padding:0}input{line-height:normal}input[type="checkbox"],input[type="radio"]{box-sizing:border-box;padding:0}input[type="number"]::-webkit-inner-spin-button,input[type="number"]::-webkit-outer-spin-button{height:auto}input[type="search"]{-webkit-appearance:textfield;-moz-box-sizing:content-box;-webkit-box-sizing:content-box;box-sizing:content-box}input[type="search"]::-webkit-search-cancel-button,input[type="search"]::-webkit-search-decoration{-webkit-appearance:none}fieldset{border:1px solid #c0c0c0;margin:0 2px;padding:0.35em 0.625em 0.75em}legend{border:0;padding:0}textarea{overflow:auto}optgroup{font-weight:bold}table{border-collapse:collapse;border-spacing:0}td,th{padding:0}
+</style>
+<style>
+body{font-family:Georgia;font-size:14px;padding:1em;line-height:1.6}.container,footer,header{max-width:72em;margin:auto}a{color:black;text-decoration:none;border-bottom:1px dashed}p{margin-top:0;margin-bottom:0;line-height:1.6em}header{text-align:center;margin-bottom:1em}#name{font-size:2.6em;font-variant:small-caps}#objective{font-style:italic}@media screen and (min-width: 72em){body{padding:2em 4em;line-height:inherit}#name{float:left;text-align:left}#contact,#objective{text-align:right}}.date{float:right;text-align-last:right}@media screen{.print-only{display:none}}header ul{list-style:none;padding:0;margin:0}header li{display:inline-block;line-height:1.5em}header li::after{content:" |"}header li:last-child::after{content:""}footer{text-align:center}h1,h2,h3,h4{font-weight:normal;margin:0}.container .label{border-bottom:1px solid}section{margin:1.25em 0}section:first-child{margin-top:0.25em}h2{font-style:italic;border-bottom:1px solid grey;margin-bottom:0.5em}.container ul{margin-top:0.1em;margin-bottom:0.1em;padding-left:20px}.entry{margin:0.75em 0}h3{display:inline-block;font-weight:bold}.entry .role{}.entry .role::before{content:"("}.entry .role::after{content:")"}.entry .loc{font-style:italic}.entry .des{font-style:italic}p .entry .des{margin-top:0.1em}.resume-objective{}.resume-project .project-name{font-weight:bold;line-height:1.6em}.resume-project h3{}.meta{}.open-link svg{width:1em;height:1em;margin-left:0.2em;vertical-align:-0.125em}.open-link::after{font-size:0.8em}
+</style>
+<style media="print">
+body{padding:0;margin:0;font-size:13px;line-height:inherit}a{text-decoration:none;border-bottom:none}.no-print{display:none}#name{float:left;text-align:left}#contact,#objective{text-align:right}
+</style>
+</head>
+<body>
+<svg width="0" height="0" style="position:absolute"><symbol id="extlink" viewBox="0 0 24 24"><path d="M 5 3 C 3.9069372 3 3 3.9069372 3 5 L 3 19 C 3 20.093063 3.9069372 21 5 21 L 19 21 C 20.093063 21 21 20.093063 21 19 L 21 12 L 19 12 L 19 19 L 5 19 L 5 5 L 12 5 L 12 3 L 5 3 z M 14 3 L 14 5 L 17.585938 5 L 8.2929688 14.292969 L 9.7070312 15.707031 L 19 6.4140625 L 19 10 L 21 10 L 21 3 L 14 3 z"></path></symbol></svg>
+<header>
+__CONTACT_INFO__
+</header>
+<div class="container">
+__SUMMARY__
+</div>
+<div class="container">
+__SECTIONS__
+</div>
+</body>
+</html>
+"""
+)
+_TEMPLATE_PARTS = tuple(
+    _split_template(
+        _TEMPLATE,
+        ["__NAME__", "__CONTACT_INFO__", "__SUMMARY__", "__SECTIONS__"],
+    )
+)
+
+# Variant used when the resume has no summary: the container div that
+# would wrap it is dropped from the surrounding chunks instead of being
+# emitted empty.
+_TEMPLATE_PARTS_NO_SUMMARY = (
+    _TEMPLATE_PARTS[0],
+    _TEMPLATE_PARTS[1],
+    _TEMPLATE_PARTS[2][: -len('<div class="container">\n')]
+    + _TEMPLATE_PARTS[3][len("\n</div>\n") :],
+    _TEMPLATE_PARTS[4],
+)
+
+# The same chunks pre-encoded once, so the save path never re-encodes
+# the static bulk of the document.
+_TEMPLATE_PARTS_BYTES = tuple(part.encode("utf-8") for part in _TEMPLATE_PARTS)
+_TEMPLATE_PARTS_NO_SUMMARY_BYTES = tuple(
+    part.encode("utf-8") for part in _TEMPLATE_PARTS_NO_SUMMARY
+)
+
+
 class Resume:
+    __slots__ = ("contact_info", "summary", "sections", "_rendered")
+
+    TEMPLATE = _TEMPLATE
+
     def __init__(
         self,
         contact_info: ContactInfo,
-        summary: Summary | None,
         sections: List[Section],
+        summary: Optional[Summary] = None,
     ) -> None:
         self.contact_info = contact_info
         self.summary = summary
         self.sections = sections
-        self.TEMPLATE = dedent(
-            """
-        <!DOCTYPE html>
-        <html>
-        <head>
-        <meta charset="utf-8">
-        <meta name="viewport" content="width=device-width; initial-scale=1.0; maximum-scale=1.0; user-scalable=0;" />
-        <title>__NAME__&rsquo;s Resume</title>
-        <style>
-        html{font-family:sans-serif;-ms-text-size-adjust:100%;-webkit-text-size-adjust:100%}body{margin:0}article,aside,details,figcaption,figure,footer,header,hgroup,main,menu,nav,section,summary{display:block}audio,canvas,progress,video{display:inline-block;vertical-align:baseline}audio:not([controls]){display:none;height:0}[hidden],template{display:none}a{background-color:transparent}a:active,a:hover{outline:0}abbr[title]{border-bottom:1px dotted}b,strong{font-weight:bold}dfn{font-style:italic}h1{font-size:2em;margin:0.67em 0}mark{background:#ff0;color:#000}small{font-size:80%}sub,sup{font-size:75%;line-height:0;position:relative;vertical-align:baseline}sup{top:-0.5em}sub{bottom:-0.25em}img{border:0}svg:not(:root){overflow:hidden}figure{margin:1em 40px}hr{-moz-box-sizing:content-box;box-sizing:content-box;height:0}pre{overflow:auto}code,kbd,pre,samp{font-family:monospace, monospace;font-size:1em}button,input,optgroup,select,textarea{color:inherit;font:inherit;margin:0}button{overflow:visible}button,select{text-transform:none}button,html input[type="button"],input[type="reset"],input[type="submit"]{-webkit-appearance:button;cursor:pointer}button[disabled],html input[disabled]{cursor:default}button::-moz-focus-inner,input::-moz-focus-inner{border:0;padding:0}input{line-height:normal}input[type="checkbox"],input[type="radio"]{box-sizing:border-box;padding:0}input[type="number"]::-webkit-inner-spin-button,input[type="number"]::-webkit-outer-spin-button{height:auto}input[type="search"]{-webkit-appearance:textfield;-moz-box-sizing:content-box;-webkit-box-sizing:content-box;box-sizing:content-box}input[type="search"]::-webkit-search-cancel-button,input[type="search"]::-webkit-search-decoration{-webkit-appearance:none}fieldset{border:1px solid #c0c0c0;margin:0 2px;padding:0.35em 0.625em 0.75em}legend{border:0;padding:0}textarea{overflow:auto}optgroup{font-weight:bold}table{border-collapse:collapse;border-spacing:0}td,th{padding:0}
-        </style>
-        <style>
-        body{font-family:Georgia;font-size:14px;padding:1em;line-height:1.6}.container,footer,header{max-width:72em;margin:auto}a{color:black;text-decoration:none;border-bottom:1px dashed}p{margin-top:0;margin-bottom:0;line-height:1.6em}header{text-align:center;margin-bottom:1em}#name{font-size:2.6em;font-variant:small-caps}#objective{font-style:italic}@media screen and (min-width: 72em){body{padding:2em 4em;line-height:inherit}#name{float:left;text-align:left}#contact,#objective{text-align:right}}.date{float:right;text-align-last:right}@media screen{.print-only{display:none}}header ul{list-style:none;padding:0;margin:0}header li{display:inline-block;line-height:1.5em}header li::after{content:" |"}header li:last-child::after{content:""}footer{text-align:center}h1,h2,h3,h4{font-weight:normal;margin:0}.container .label{border-bottom:1px solid}section{margin:1.25em 0}section:first-child{margin-top:0.25em}h2{font-style:italic;border-bottom:1px solid grey;margin-bottom:0.5em}.container ul{margin-top:0.1em;margin-bottom:0.1em;padding-left:20px}.entry{margin:0.75em 0}h3{display:inline-block;font-weight:bold}.entry .role{}.entry .role::before{content:"("}.entry .role::after{content:")"}.entry .loc{font-style:italic}.entry .des{font-style:italic}p .entry .des{margin-top:0.1em}.resume-objective{}.resume-project .project-name{font-weight:bold;line-height:1.6em}.resume-project h3{}.meta{}.open-link{padding-right:1.2em;background-image:url('data:image/svg+xml;base64,PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHg9IjBweCIgeT0iMHB4IiB3aWR0aD0iMjQiIGhlaWdodD0iMjQiIHZpZXdCb3g9IjAgMCAyNCAyNCI+CjxwYXRoIGQ9Ik0gNSAzIEMgMy45MDY5MzcyIDMgMyAzLjkwNjkzNzIgMyA1IEwgMyAxOSBDIDMgMjAuMDkzMDYzIDMuOTA2OTM3MiAyMSA1IDIxIEwgMTkgMjEgQyAyMC4wOTMwNjMgMjEgMjEgMjAuMDkzMDYzIDIxIDE5IEwgMjEgMTIgTCAxOSAxMiBMIDE5IDE5IEwgNSAxOSBMIDUgNSBMIDEyIDUgTCAxMiAzIEwgNSAzIHogTSAxNCAzIEwgMTQgNSBMIDE3LjU4NTkzOCA1IEwgOC4yOTI5Njg4IDE0LjI5Mjk2OSBMIDkuNzA3MDMxMiAxNS43MDcwMzEgTCAxOSA2LjQxNDA2MjUgTCAxOSAxMCBMIDIxIDEwIEwgMjEgMyBMIDE0IDMgeiI+PC9wYXRoPgo8L3N2Zz4=');background-repeat:no-repeat;background-size:1em 1em;background-position:right center}.open-link::after{font-size:0.8em}
-        </style>
-        <style media="print">
-        body{padding:0;margin:0;font-size:13px;line-height:inherit}a{text-decoration:none;border-bottom:none}.no-print{display:none}#name{float:left;text-align:left}#contact,#objective{text-align:right}
-        </style>
-        </head>
-        <body>
-        <header>
-        __CONTACT_INFO__
-        </header>
-        <div class="container">
-        __SUMMARY__
-        </div>
-        <div class="container">
-        __SECTIONS__
-        </div>
-        </body>
-        </html>
-        """
-        )
+        # Rendered-document cache, same idea as Text._cached: the resume
+        # tree is treated as immutable once built.
+        self._rendered: Optional[bytes] = None
 
-    def render_contact_info(self) -> str:
-        contact_info = f'<h1 id="name">{self.contact_info.name}</h1>\n'
+    def render_contact_info(self, name: Optional[str] = None) -> str:
+        # render() passes the already-stringified name so it is only
+        # formatted once per render.
+        if name is None:
+            name = str(self.contact_info.name)
+        parts = [f'<h1 id="name">{name}</h1>\n']
 
         if self.contact_info.details:
-            contact_info += '<ul id="contact">\n'
+            append = parts.append
+            append('<ul id="contact">\n')
             for detail in self.contact_info.details:
-                contact_info += f"<li>{detail}</li>\n"
-            contact_info += "</ul>\n"
+                append(f"<li>{_s(detail)}</li>\n")
+            append("</ul>\n")
         if self.contact_info.tag_line:
-            contact_info += f'<p id="objective">{self.contact_info.tag_line}</p>\n'
+            parts.append(f'<p id="objective">{_s(self.contact_info.tag_line)}</p>\n')
         else:
-            contact_info += '<br>\n'
-        return contact_info
+            parts.append('<br>\n')
+        return "".join(parts)
 
     def render_summary(self) -> str:
         if not self.summary:
             return ""
 
-        summary_html = "<div class='container'>\n"
-        summary_html += "<section>\n"
-        summary_html += f"<h2>{self.summary.title}</h2>\n"
-        summary_html += '<div class="entry">\n'
-        summary_html += f"<p>\n{self.summary.description}</p>\n"
-        summary_html += "</div>"
-        summary_html += "</section>\n"
-        summary_html += "</div>\n"
-
-        return summary_html
+        parts = ["<section>\n"]
+        if self.summary.title:
+            parts.append(f"<h2>{_s(self.summary.title)}</h2>\n")
+        parts.append('<div class="entry">\n')
+        if self.summary.description:
+            parts.append(f"<p>\n{_s(self.summary.description)}</p>\n")
+        parts.append("</div>")
+        parts.append("</section>\n")
+        return "".join(parts)
 
     def render_section(self, section: Section) -> str:
-        section_html = "<div class='container'>\n"
-        section_html += "<section>\n"
-        if section.title:
-            section_html += f"<h2>{section.title}</h2>\n"
-        for entry in section.entries:
-            section_html += '<div class="entry">\n'
-            if entry.title:
-                section_html += f"<h3>{entry.title}</h3>\n"
-            if entry.caption:
-                section_html += f'<span class="role">{entry.caption}</span>\n'
-            if entry.location:
-                section_html += f'<span class="loc">{entry.location}</span>\n'
-            if entry.dates:
-                section_html += f'<span class="date">{entry.dates}</span>\n'
-            if entry.description:
-                section_html += f"<p>\n{entry.description}</p>\n"
-            section_html += "</div>\n"
-        section_html += "</section>\n"
-        section_html += "</div>\n"
-        return section_html
+        return section.render()
 
     def render_sections(self) -> str:
-        sections_html = ""
-        for section in self.sections:
-            sections_html += self.render_section(section)
-        return sections_html
+        sections = self.sections
+        render_section = self.render_section
+        if len(sections) > _PARALLEL_SECTION_THRESHOLD:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(8, len(sections))) as executor:
+                return "".join(executor.map(render_section, sections))
+        return "".join([render_section(section) for section in sections])
+
+    def _render_dynamic(self) -> List[str]:
+        """The dynamic slot values in template order.
+
+        The summary slot is omitted entirely when there is no summary;
+        render()/_render_bytes() pair the result with the matching
+        template-chunk variant.
+        """
+        name = _s(self.contact_info.name)
+        dynamic = [name, self.render_contact_info(name)]
+        if self.summary is not None:
+            dynamic.append(self.render_summary())
+        dynamic.append(self.render_sections())
+        return dynamic
 
     def render(self) -> str:
-        s = self.TEMPLATE.replace("__NAME__", str(self.contact_info.name))
-        s = s.replace("__CONTACT_INFO__", self.render_contact_info())
-        s = s.replace("__SUMMARY__", self.render_summary())
-        s = s.replace("__SECTIONS__", self.render_sections())
-        return s
+        return self._render_bytes().decode("utf-8")
+
+    def _iter_bytes(self) -> Iterator[bytes]:
+        """Yield the encoded document as chunks in template order."""
+        cached = self._rendered
+        if cached is not None:
+            yield cached
+            return
+        parts = (
+            _TEMPLATE_PARTS_BYTES
+            if self.summary is not None
+            else _TEMPLATE_PARTS_NO_SUMMARY_BYTES
+        )
+        yield parts[0]
+        for value, static in zip(self._render_dynamic(), parts[1:]):
+            yield value.encode("utf-8")
+            yield static
+
+    def render_to(self, writer: BinaryIO) -> None:
+        """Stream the rendered document to a binary writer chunk by chunk.
+
+        Nothing is buffered beyond the individual chunks, so a web
+        handler can stream straight to a socket without holding the
+        whole document in memory.
+        """
+        write = writer.write
+        for chunk in self._iter_bytes():
+            write(chunk)
+
+    def _render_bytes(self) -> bytes:
+        cached = self._rendered
+        if cached is not None:
+            return cached
+        cached = self._rendered = b"".join(self._iter_bytes())
+        return cached
 
     def save(self, filename: str) -> None:
-        with open(filename, "w") as f:
-            f.write(self.render())
-
-    def cli_main(self):
-        parser = argparse.ArgumentParser(description="ResumeBuilder")
-        parser.add_argument(
-            "-o",
-            "--output",
-            type=str,
-            dest="output_file",
-            required=True,
-            help="Output HTML file name.",
-        )
-        args = parser.parse_args()
-        self.save(args.output_file)
+        # Write pre-encoded bytes through a large buffer so big documents
+        # go to disk in few syscalls and skip TextIOWrapper's incremental
+        # encoder.
+        with open(filename, "wb", buffering=1 << 20) as f:
+            self.render_to(f)
+
+    def cli_main(self) -> None:
+        # The CLI takes a single flag; parsing it by hand keeps argparse
+        # (and everything it drags in) off the startup path.
+        argv = sys.argv[1:]
+        output_file = None
+        i = 0
+        n = len(argv)
+        while i < n:
+            arg = argv[i]
+            if arg in ("-h", "--help"):
+                print(
+                    f"usage: {sys.argv[0]} [-h] -o OUTPUT_FILE\n\n"
+                    "ResumeBuilder\n\n"
+                    "  -o, --output OUTPUT_FILE   Output HTML file name."
+                )
+                sys.exit(0)
+            elif arg in ("-o", "--output"):
+                i += 1
+                if i == n:
+                    sys.exit(f"error: argument {arg}: expected a file name")
+                output_file = argv[i]
+            elif arg.startswith("--output="):
+                output_file = arg[len("--output=") :]
+            else:
+                sys.exit(f"error: unrecognized argument: {arg}")
+            i += 1
+        if output_file is None:
+            sys.exit("error: the -o/--output argument is required")
+        self.save(output_file)